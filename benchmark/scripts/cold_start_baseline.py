@@ -9,6 +9,8 @@ with Aetherless CRIU-based warm pools.
 """
 
 import argparse
+import concurrent.futures
+import gc
 import json
 import os
 import socket
@@ -22,6 +24,33 @@ from pathlib import Path
 from statistics import mean, median, stdev
 from typing import List, Optional
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; stats fall back to the stdlib path.
+    np = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; serialization falls back to json.
+    orjson = None
+
+
+# Set by --rigorous: automatic GC is disabled for the whole run and each
+# benchmark collects explicitly between samples, so no GC pause can land
+# inside a timed region.
+_RIGOROUS = False
+
+
+def _pre_sample_gc():
+    """Collect garbage outside the timed region in --rigorous mode."""
+    if _RIGOROUS:
+        gc.collect()
+
+
+def default_warmup(iterations: int) -> int:
+    """Warmup iterations to run and discard before sampling."""
+    return max(3, iterations // 10)
+
 
 @dataclass
 class LatencyMetrics:
@@ -33,24 +62,63 @@ class LatencyMetrics:
     p95_ns: int
     p99_ns: int
     std_dev_ns: float
+    # Outlier-robust statistics (pyperf-style): median absolute deviation
+    # and the mean over samples within +/-2 MAD of the median.
+    mad_ns: float = 0.0
+    trimmed_mean_ns: float = 0.0
     samples: Optional[List[int]] = None
 
     @classmethod
     def from_samples(cls, samples_ns: List[int], keep_raw: bool = True) -> "LatencyMetrics":
-        if not samples_ns:
+        n = len(samples_ns)
+        if n == 0:
             return cls(0, 0, 0.0, 0, 0, 0, 0.0)
-        
+
+        if np is not None:
+            arr = np.asarray(samples_ns, dtype=np.int64)
+            if keep_raw:
+                # Raw samples are reported sorted, so a full sort is needed
+                # anyway; quantiles come out of the same array.
+                arr = np.sort(arr)
+                part = arr
+            else:
+                kth = sorted({0, n - 1, n // 2, int(n * 0.95), int(n * 0.99)})
+                part = np.partition(arr, kth)
+            median_ns = int(part[n // 2])
+            deviations = np.abs(arr - median_ns)
+            mad_ns = float(np.median(deviations))
+            trimmed = arr[deviations <= 2 * mad_ns] if mad_ns > 0 else arr
+            return cls(
+                min_ns=int(part[0]),
+                max_ns=int(part[n - 1]),
+                mean_ns=float(arr.mean()),
+                median_ns=median_ns,
+                p95_ns=int(part[int(n * 0.95)]),
+                p99_ns=int(part[int(n * 0.99)]),
+                std_dev_ns=float(arr.std(ddof=1)) if n > 1 else 0.0,
+                mad_ns=mad_ns,
+                trimmed_mean_ns=float(trimmed.mean()),
+                samples=arr.tolist() if keep_raw else None,
+            )
+
         sorted_samples = sorted(samples_ns)
-        n = len(sorted_samples)
-        
+        median_ns = sorted_samples[n // 2]
+        mad_ns = float(median(abs(s - median_ns) for s in sorted_samples))
+        if mad_ns > 0:
+            trimmed = [s for s in sorted_samples if abs(s - median_ns) <= 2 * mad_ns]
+        else:
+            trimmed = sorted_samples
+
         return cls(
             min_ns=sorted_samples[0],
             max_ns=sorted_samples[-1],
             mean_ns=mean(sorted_samples),
-            median_ns=sorted_samples[n // 2],
+            median_ns=median_ns,
             p95_ns=sorted_samples[int(n * 0.95)],
             p99_ns=sorted_samples[int(n * 0.99)],
             std_dev_ns=stdev(sorted_samples) if n > 1 else 0.0,
+            mad_ns=mad_ns,
+            trimmed_mean_ns=float(mean(trimmed)),
             samples=sorted_samples if keep_raw else None,
         )
 
@@ -65,20 +133,47 @@ class BenchmarkResult:
     metadata: dict
 
 
-def benchmark_python_spawn(iterations: int) -> BenchmarkResult:
-    """Benchmark raw Python interpreter spawn time."""
+def benchmark_python_spawn(iterations: int, warmup: Optional[int] = None) -> BenchmarkResult:
+    """Benchmark raw Python interpreter spawn time.
+
+    Uses os.posix_spawn with a bare stdout pipe rather than
+    subprocess.run, so the samples capture interpreter startup instead of
+    Popen object construction, pipe plumbing, and the communicate thread.
+    """
+    if warmup is None:
+        warmup = default_warmup(iterations)
     samples = []
-    
-    for _ in range(iterations):
-        start = time.perf_counter_ns()
-        proc = subprocess.run(
-            [sys.executable, "-c", "print('ready')"],
-            capture_output=True,
-            check=True,
-        )
-        elapsed = time.perf_counter_ns() - start
-        samples.append(elapsed)
-    
+
+    # Precompute argv/env once; the spawn itself is what's being timed.
+    argv = [sys.executable, "-c", "print('ready')"]
+    env = dict(os.environ)
+    devnull = os.open(os.devnull, os.O_WRONLY)
+
+    try:
+        for i in range(warmup + iterations):
+            r_pipe, w_pipe = os.pipe()
+            _pre_sample_gc()
+            start = time.perf_counter_ns()
+            pid = os.posix_spawn(
+                sys.executable,
+                argv,
+                env,
+                file_actions=[
+                    (os.POSIX_SPAWN_DUP2, w_pipe, 1),
+                    (os.POSIX_SPAWN_DUP2, devnull, 2),
+                ],
+            )
+            os.close(w_pipe)
+            while os.read(r_pipe, 4096):
+                pass
+            os.waitpid(pid, 0)
+            elapsed = time.perf_counter_ns() - start
+            if i >= warmup:
+                samples.append(elapsed)
+            os.close(r_pipe)
+    finally:
+        os.close(devnull)
+
     return BenchmarkResult(
         name="baseline_python_spawn",
         category="cold_start",
@@ -88,8 +183,10 @@ def benchmark_python_spawn(iterations: int) -> BenchmarkResult:
     )
 
 
-def benchmark_python_import_heavy(iterations: int) -> BenchmarkResult:
+def benchmark_python_import_heavy(iterations: int, warmup: Optional[int] = None) -> BenchmarkResult:
     """Benchmark Python spawn with heavy imports (simulates real-world Lambda)."""
+    if warmup is None:
+        warmup = default_warmup(iterations)
     samples = []
     
     # Script that imports common Lambda dependencies
@@ -102,7 +199,8 @@ import urllib.request
 print('ready')
 """
     
-    for _ in range(iterations):
+    for i in range(warmup + iterations):
+        _pre_sample_gc()
         start = time.perf_counter_ns()
         proc = subprocess.run(
             [sys.executable, "-c", script],
@@ -110,7 +208,8 @@ print('ready')
             check=True,
         )
         elapsed = time.perf_counter_ns() - start
-        samples.append(elapsed)
+        if i >= warmup:
+            samples.append(elapsed)
     
     return BenchmarkResult(
         name="baseline_python_import_heavy",
@@ -125,7 +224,71 @@ print('ready')
     )
 
 
-def benchmark_simulated_lambda_cold_start(iterations: int) -> BenchmarkResult:
+def benchmark_python_forked_import(iterations: int, warmup: Optional[int] = None) -> BenchmarkResult:
+    """Benchmark fork from a process that already imported heavy modules.
+
+    One long-lived helper pays interpreter bootstrap and the heavy
+    imports once, then forks a child per iteration on request. This is
+    the "import cache" / prefork tier of cold start (a la SOCK) that
+    sits between a raw spawn and a CRIU-restored warm pool.
+    """
+    if warmup is None:
+        warmup = default_warmup(iterations)
+    samples = []
+
+    forkserver_script = """
+import http.server
+import json
+import os
+import sys
+import urllib.request
+
+sys.stdout.write('warm\\n')
+sys.stdout.flush()
+while sys.stdin.buffer.read(1):
+    pid = os.fork()
+    if pid == 0:
+        sys.stdout.write('ready\\n')
+        sys.stdout.flush()
+        os._exit(0)
+    os.waitpid(pid, 0)
+"""
+
+    proc = subprocess.Popen(
+        [sys.executable, "-c", forkserver_script],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        proc.stdout.readline()  # wait for imports to finish
+        for i in range(warmup + iterations):
+            _pre_sample_gc()
+            start = time.perf_counter_ns()
+            proc.stdin.write(b"\n")
+            proc.stdin.flush()
+            proc.stdout.readline()
+            elapsed = time.perf_counter_ns() - start
+            if i >= warmup:
+                samples.append(elapsed)
+    finally:
+        proc.stdin.close()
+        proc.wait()
+
+    return BenchmarkResult(
+        name="baseline_python_forked_import",
+        category="cold_start",
+        iterations=iterations,
+        metrics=LatencyMetrics.from_samples(samples),
+        metadata={
+            "runtime": "python3",
+            "operation": "fork_from_warm_imports",
+            "imports": ["json", "os", "sys", "http.server", "urllib.request"],
+        },
+    )
+
+
+def benchmark_simulated_lambda_cold_start(iterations: int, warmup: Optional[int] = None) -> BenchmarkResult:
     """
     Simulate AWS Lambda cold start overhead.
     
@@ -134,13 +297,16 @@ def benchmark_simulated_lambda_cold_start(iterations: int) -> BenchmarkResult:
     - Runtime bootstrap (~20-50ms)
     - Network setup (~10-20ms)
     """
+    if warmup is None:
+        warmup = default_warmup(iterations)
     samples = []
-    
+
     # Simulated overhead (conservative estimates)
     CONTAINER_INIT_MS = 75  # Average container spin-up
     RUNTIME_BOOTSTRAP_MS = 35  # Runtime initialization
-    
-    for _ in range(iterations):
+
+    for i in range(warmup + iterations):
+        _pre_sample_gc()
         start = time.perf_counter_ns()
         
         # Simulate container initialization
@@ -155,9 +321,10 @@ def benchmark_simulated_lambda_cold_start(iterations: int) -> BenchmarkResult:
         
         # Simulate runtime bootstrap overhead
         time.sleep(RUNTIME_BOOTSTRAP_MS / 1000)
-        
+
         elapsed = time.perf_counter_ns() - start
-        samples.append(elapsed)
+        if i >= warmup:
+            samples.append(elapsed)
     
     return BenchmarkResult(
         name="baseline_lambda_simulated_cold_start",
@@ -174,8 +341,10 @@ def benchmark_simulated_lambda_cold_start(iterations: int) -> BenchmarkResult:
     )
 
 
-def benchmark_http_handler_cold_start(iterations: int) -> BenchmarkResult:
+def benchmark_http_handler_cold_start(iterations: int, warmup: Optional[int] = None) -> BenchmarkResult:
     """Benchmark cold start with full HTTP handler initialization."""
+    if warmup is None:
+        warmup = default_warmup(iterations)
     samples = []
     
     handler_script = '''
@@ -197,45 +366,53 @@ sock.send(b'READY')
 sock.close()
 '''
     
-    for _ in range(iterations):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            socket_path = os.path.join(tmpdir, "bench.sock")
-            handler_path = os.path.join(tmpdir, "handler.py")
-            
-            with open(handler_path, "w") as f:
-                f.write(handler_script)
-            
-            # Create Unix socket listener
-            server_sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            server_sock.bind(socket_path)
-            server_sock.listen(1)
-            server_sock.settimeout(10)
-            
-            start = time.perf_counter_ns()
-            
-            # Spawn handler
-            proc = subprocess.Popen(
-                [sys.executable, handler_path],
-                env={**os.environ, "BENCHMARK_SOCKET": socket_path},
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-            
-            try:
-                # Wait for READY signal
-                conn, _ = server_sock.accept()
-                data = conn.recv(8)
-                if data.startswith(b"READY"):
-                    elapsed = time.perf_counter_ns() - start
-                    samples.append(elapsed)
-                conn.close()
-            except socket.timeout:
-                pass
-            finally:
-                proc.terminate()
-                proc.wait()
-                server_sock.close()
-    
+    # Tempdir, handler script, and listening socket are set up once:
+    # filesystem churn is not part of cold-start semantics and its
+    # variance would otherwise inflate p99 inside the timed region.
+    with tempfile.TemporaryDirectory() as tmpdir:
+        socket_path = os.path.join(tmpdir, "bench.sock")
+        handler_path = os.path.join(tmpdir, "handler.py")
+
+        with open(handler_path, "w") as f:
+            f.write(handler_script)
+
+        # Create Unix socket listener, reused across all iterations
+        server_sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server_sock.bind(socket_path)
+        server_sock.listen(128)
+        server_sock.settimeout(10)
+
+        env = {**os.environ, "BENCHMARK_SOCKET": socket_path}
+
+        try:
+            for i in range(warmup + iterations):
+                _pre_sample_gc()
+                start = time.perf_counter_ns()
+
+                # Spawn handler
+                proc = subprocess.Popen(
+                    [sys.executable, handler_path],
+                    env=env,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+
+                try:
+                    # Wait for READY signal
+                    conn, _ = server_sock.accept()
+                    data = conn.recv(8)
+                    if data.startswith(b"READY") and i >= warmup:
+                        elapsed = time.perf_counter_ns() - start
+                        samples.append(elapsed)
+                    conn.close()
+                except socket.timeout:
+                    pass
+                finally:
+                    proc.terminate()
+                    proc.wait()
+        finally:
+            server_sock.close()
+
     return BenchmarkResult(
         name="baseline_python_http_handler",
         category="cold_start",
@@ -267,9 +444,21 @@ def main():
                         help="Output directory for results")
     parser.add_argument("--iterations", type=int, default=20,
                         help="Number of iterations per benchmark")
+    parser.add_argument("--parallel", action="store_true",
+                        help="Run the independent benchmarks concurrently; "
+                             "faster but sacrifices measurement isolation")
+    parser.add_argument("--rigorous", action="store_true",
+                        help="Disable automatic GC and collect between "
+                             "samples to keep GC pauses out of the "
+                             "timed regions")
     args = parser.parse_args()
-    
+
     args.output.mkdir(parents=True, exist_ok=True)
+
+    if args.rigorous:
+        global _RIGOROUS
+        _RIGOROUS = True
+        gc.disable()
     
     print("Cold Start Baseline Benchmarks")
     print("=" * 40)
@@ -277,19 +466,26 @@ def main():
     print()
     
     results = []
-    
+
+    benchmarks = [
+        ("python_spawn", benchmark_python_spawn),
+        ("python_import_heavy", benchmark_python_import_heavy),
+        ("python_forked_import", benchmark_python_forked_import),
+        ("simulated_lambda_cold_start", benchmark_simulated_lambda_cold_start),
+        ("http_handler_cold_start", benchmark_http_handler_cold_start),
+    ]
+
     # Run benchmarks
-    print("Running python_spawn...")
-    results.append(benchmark_python_spawn(args.iterations))
-    
-    print("Running python_import_heavy...")
-    results.append(benchmark_python_import_heavy(args.iterations))
-    
-    print("Running simulated_lambda_cold_start...")
-    results.append(benchmark_simulated_lambda_cold_start(args.iterations))
-    
-    print("Running http_handler_cold_start...")
-    results.append(benchmark_http_handler_cold_start(args.iterations))
+    if args.parallel:
+        print("Running all benchmarks in parallel (reduced measurement "
+              "isolation; fine for CI sanity runs, not publication numbers)")
+        with concurrent.futures.ProcessPoolExecutor(max_workers=len(benchmarks)) as executor:
+            futures = [executor.submit(fn, args.iterations) for _, fn in benchmarks]
+            results.extend(f.result() for f in futures)
+    else:
+        for name, fn in benchmarks:
+            print(f"Running {name}...")
+            results.append(fn(args.iterations))
     
     # Print summary
     print()
@@ -304,33 +500,29 @@ def main():
     timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H-%M-%SZ")
     output_file = args.output / f"cold_start_baseline_{timestamp}.json"
     
+    # asdict walks each BenchmarkResult once instead of re-flattening
+    # every metrics field by hand; raw samples stay out of the report.
+    result_dicts = []
+    for r in results:
+        d = asdict(r)
+        d["metrics"].pop("samples", None)
+        result_dicts.append(d)
+
     report = {
         "benchmark_suite": "aetherless-benchmarks",
         "version": "0.1.0",
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "type": "baseline",
-        "results": [
-            {
-                "name": r.name,
-                "category": r.category,
-                "iterations": r.iterations,
-                "metrics": {
-                    "min_ns": r.metrics.min_ns,
-                    "max_ns": r.metrics.max_ns,
-                    "mean_ns": r.metrics.mean_ns,
-                    "median_ns": r.metrics.median_ns,
-                    "p95_ns": r.metrics.p95_ns,
-                    "p99_ns": r.metrics.p99_ns,
-                    "std_dev_ns": r.metrics.std_dev_ns,
-                },
-                "metadata": r.metadata,
-            }
-            for r in results
-        ],
+        "results": result_dicts,
     }
-    
-    with open(output_file, "w") as f:
-        json.dump(report, f, indent=2)
+
+    if orjson is not None:
+        payload = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(report, indent=2).encode()
+
+    with open(output_file, "wb") as f:
+        f.write(payload)
     
     print()
     print(f"Results saved to: {output_file}")
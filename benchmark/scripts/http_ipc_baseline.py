@@ -9,11 +9,17 @@ Aetherless zero-copy shared memory.
 """
 
 import argparse
+import array
+import ctypes
+import http.client
 import json
+import mmap
+import os
+import signal
 import socket
 import threading
 import time
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from pathlib import Path
@@ -21,8 +27,93 @@ from statistics import mean, median, stdev
 from typing import List, Optional
 from urllib.request import urlopen, Request
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; stats fall back to the stdlib path.
+    np = None
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # orjson is optional; the handler falls back to json.
+    orjson = None
+
+
+# CPU the echo peers pin themselves to; set from --pin-cores in main().
+_SERVER_CPU: Optional[int] = None
+
+# Direct clock_gettime(CLOCK_MONOTONIC_RAW) into a reused timespec: the
+# sub-10us ping-pong loops are short enough that perf_counter_ns's
+# PyLong boxing per call is visible in the noise floor.
+_CLOCK_MONOTONIC_RAW = 4
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+try:
+    _clock_gettime = ctypes.CDLL("libc.so.6", use_errno=True).clock_gettime
+except (OSError, AttributeError):  # non-glibc platforms
+    _clock_gettime = None
+
+
+# Not exposed by CPython's socket module; value from <asm-generic/socket.h>.
+_SO_BUSY_POLL = getattr(socket, "SO_BUSY_POLL", 46)
+
+
+def _enable_busy_poll(sock: socket.socket, usec: int = 50) -> None:
+    """Ask the kernel to busy-poll the receive path (best effort).
+
+    Busy polling removes the schedule-and-wake cost from blocking recv,
+    which is most of the latency for 64B messages. It needs
+    CAP_NET_ADMIN (or a kernel allowing unprivileged busy poll), so a
+    refused setsockopt is silently ignored.
+    """
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, _SO_BUSY_POLL, usec)
+    except OSError:
+        pass
+
+
+def _pin_to_cpu(cpu: Optional[int]) -> None:
+    """Pin the calling thread/process to a single CPU (best effort)."""
+    if cpu is None or not hasattr(os, "sched_setaffinity"):
+        return
+    try:
+        os.sched_setaffinity(0, {cpu})
+    except OSError:
+        pass
+
+
+class WelfordAccumulator:
+    """Single-pass running min/max/mean/variance (Welford's algorithm).
+
+    Folding each sample in as it is taken yields min/max/mean/stddev
+    with no extra passes at reduction time; only the quantiles still
+    need a partition of the stored samples.
+    """
+
+    __slots__ = ("n", "mean", "m2", "min_ns", "max_ns")
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def add(self, sample_ns: int) -> None:
+        self.n += 1
+        delta = sample_ns - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (sample_ns - self.mean)
+        if sample_ns < self.min_ns or self.n == 1:
+            self.min_ns = sample_ns
+        if sample_ns > self.max_ns:
+            self.max_ns = sample_ns
+
+
+@dataclass(frozen=True, slots=True)
 class LatencyMetrics:
     min_ns: int
     max_ns: int
@@ -34,10 +125,25 @@ class LatencyMetrics:
 
     @classmethod
     def from_samples(cls, samples_ns: List[int]) -> "LatencyMetrics":
-        if not samples_ns:
+        n = len(samples_ns)
+        if n == 0:
             return cls(0, 0, 0.0, 0, 0, 0, 0.0)
+        if np is not None:
+            # Single C pass: partition at the quantile indices (O(n))
+            # instead of a full Python-object sort, mean/std in NumPy.
+            arr = np.asarray(samples_ns, dtype=np.int64)
+            kth = sorted({0, n - 1, n // 2, int(n * 0.95), int(n * 0.99)})
+            part = np.partition(arr, kth)
+            return cls(
+                min_ns=int(part[0]),
+                max_ns=int(part[n - 1]),
+                mean_ns=float(arr.mean()),
+                median_ns=int(part[n // 2]),
+                p95_ns=int(part[int(n * 0.95)]),
+                p99_ns=int(part[int(n * 0.99)]),
+                std_dev_ns=float(arr.std(ddof=1)) if n > 1 else 0.0,
+            )
         sorted_samples = sorted(samples_ns)
-        n = len(sorted_samples)
         return cls(
             min_ns=sorted_samples[0],
             max_ns=sorted_samples[-1],
@@ -48,18 +154,72 @@ class LatencyMetrics:
             std_dev_ns=stdev(sorted_samples) if n > 1 else 0.0,
         )
 
+    @classmethod
+    def from_accumulator(cls, acc: WelfordAccumulator, samples_ns: List[int]) -> "LatencyMetrics":
+        """Build metrics from a hot-loop accumulator plus its raw samples."""
+        n = acc.n
+        if n == 0:
+            return cls(0, 0, 0.0, 0, 0, 0, 0.0)
+        if np is not None:
+            kth = sorted({n // 2, int(n * 0.95), int(n * 0.99)})
+            part = np.partition(np.asarray(samples_ns, dtype=np.int64), kth)
+        else:
+            part = sorted(samples_ns)
+        return cls(
+            min_ns=acc.min_ns,
+            max_ns=acc.max_ns,
+            mean_ns=acc.mean,
+            median_ns=int(part[n // 2]),
+            p95_ns=int(part[int(n * 0.95)]),
+            p99_ns=int(part[int(n * 0.99)]),
+            std_dev_ns=(acc.m2 / (n - 1)) ** 0.5 if n > 1 else 0.0,
+        )
+
+
+class NoDelayHTTPServer(HTTPServer):
+    """HTTPServer that disables Nagle on every accepted connection.
+
+    Without TCP_NODELAY small responses can sit in the kernel for up to
+    40ms waiting on delayed ACKs, which would swamp the latencies being
+    measured. Buffer sizes are pinned so the comparison stays
+    apples-to-apples with benchmark_tcp_roundtrip.
+    """
+
+    allow_reuse_address = True
+
+    def finish_request(self, request, client_address):
+        request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        request.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)
+        request.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
+        super().finish_request(request, client_address)
+
 
 class EchoHandler(BaseHTTPRequestHandler):
-    """HTTP handler that echoes JSON payloads."""
-    
+    """HTTP handler that echoes JSON payloads.
+
+    POST / parses and re-serializes the JSON (orjson's C codec when
+    installed, stdlib json otherwise); POST /raw echoes the body
+    untouched as a JSON-bypass control, so the JSON CPU cost can be read
+    off as the difference between the two.
+    """
+
+    # HTTP/1.0 would close after every response, silently reconnecting
+    # the "warm" client variants; 1.1 keeps connections persistent.
+    protocol_version = "HTTP/1.1"
+
     def do_POST(self):
         content_length = int(self.headers.get("Content-Length", 0))
         body = self.rfile.read(content_length)
-        
-        # Parse and re-serialize JSON (simulates typical serverless overhead)
-        data = json.loads(body)
-        response = json.dumps(data).encode()
-        
+
+        if self.path == "/raw":
+            response = body
+        elif orjson is not None:
+            response = orjson.dumps(orjson.loads(body))
+        else:
+            # Parse and re-serialize JSON (simulates typical serverless overhead)
+            data = json.loads(body)
+            response = json.dumps(data).encode()
+
         self.send_response(200)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", len(response))
@@ -72,149 +232,626 @@ class EchoHandler(BaseHTTPRequestHandler):
 
 def start_server(port: int, ready_event: threading.Event):
     """Start HTTP server in background thread."""
-    server = HTTPServer(("127.0.0.1", port), EchoHandler)
+    _pin_to_cpu(_SERVER_CPU)
+    server = NoDelayHTTPServer(("127.0.0.1", port), EchoHandler)
     ready_event.set()
     server.serve_forever()
 
 
-def benchmark_http_json_roundtrip(port: int, payload_size: int, iterations: int) -> List[int]:
-    """Benchmark HTTP + JSON IPC roundtrip."""
+def benchmark_http_json_roundtrip(port: int, payload_size: int, iterations: int,
+                                  path: str = "/") -> List[int]:
+    """Benchmark HTTP + JSON IPC roundtrip over a single warm connection.
+
+    Reusing one connection keeps TCP handshake and slow-start out of the
+    samples, so what's measured is the HTTP framing + JSON cost rather
+    than connect cost (see benchmark_http_json_cold_connect for the latter).
+    """
+    samples = []
+    payload = {"data": "x" * payload_size}
+    payload_bytes = json.dumps(payload).encode()
+    headers = {
+        "Content-Type": "application/json",
+        "Content-Length": str(len(payload_bytes)),
+    }
+
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    conn.connect()
+    conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    try:
+        for _ in range(iterations):
+            start = time.perf_counter_ns()
+
+            conn.request("POST", path, body=payload_bytes, headers=headers)
+            resp = conn.getresponse()
+            _ = resp.read()
+
+            elapsed = time.perf_counter_ns() - start
+            samples.append(elapsed)
+    finally:
+        conn.close()
+
+    return samples
+
+
+def benchmark_http_json_cold_connect(port: int, payload_size: int, iterations: int) -> List[int]:
+    """Benchmark HTTP + JSON IPC with a fresh connection per request."""
     samples = []
     payload = {"data": "x" * payload_size}
     payload_bytes = json.dumps(payload).encode()
     url = f"http://127.0.0.1:{port}/"
-    
+
     for _ in range(iterations):
         start = time.perf_counter_ns()
-        
+
         req = Request(url, data=payload_bytes, method="POST")
         req.add_header("Content-Type", "application/json")
-        
+
         with urlopen(req, timeout=5) as resp:
             _ = resp.read()
-        
+
         elapsed = time.perf_counter_ns() - start
         samples.append(elapsed)
-    
+
     return samples
 
 
-def benchmark_unix_socket_roundtrip(payload_size: int, iterations: int) -> List[int]:
-    """Benchmark Unix socket IPC roundtrip."""
-    import tempfile
-    import os
-    
+_RAW_RESPONSE_TEMPLATE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Content-Length: %d\r\n"
+    b"Connection: keep-alive\r\n"
+    b"\r\n%s"
+)
+
+
+def _raw_http_echo_loop(conn: socket.socket) -> None:
+    """Minimal HTTP/1.1 echo: scan headers for Content-Length, echo the body.
+
+    Collapses BaseHTTPRequestHandler's regex parsing, strftime header
+    emission and piecemeal writes into a recv loop plus one sendall.
+    """
+    buf = bytearray()
+    while True:
+        while (header_end := buf.find(b"\r\n\r\n")) == -1:
+            chunk = conn.recv(65536)
+            if not chunk:
+                return
+            buf += chunk
+        headers = bytes(buf[:header_end]).lower()
+        marker = headers.index(b"content-length:") + len(b"content-length:")
+        line_end = headers.find(b"\r\n", marker)
+        if line_end == -1:
+            line_end = len(headers)
+        content_length = int(headers[marker:line_end])
+        total = header_end + 4 + content_length
+        while len(buf) < total:
+            chunk = conn.recv(65536)
+            if not chunk:
+                return
+            buf += chunk
+        body = bytes(buf[header_end + 4:total])
+        del buf[:total]
+        conn.sendall(_RAW_RESPONSE_TEMPLATE % (len(body), body))
+
+
+def benchmark_http_raw_socket_roundtrip(payload_size: int, iterations: int) -> List[int]:
+    """Benchmark HTTP + JSON IPC with raw sockets on both ends.
+
+    The request bytes are built once and written with a single sendall
+    per iteration, and the server is a hand-rolled HTTP/1.1 echo loop in
+    a forked child. Against the warm http.client/BaseHTTPRequestHandler
+    variant this isolates how much of the HTTP number is Python protocol
+    machinery rather than wire cost.
+    """
     samples = []
-    payload = b"x" * payload_size
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        socket_path = os.path.join(tmpdir, "ipc.sock")
-        
-        # Set up server
-        server_sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        server_sock.bind(socket_path)
-        server_sock.listen(1)
-        
-        server_ready = threading.Event()
-        
-        def server_thread():
-            server_ready.set()
+    payload = {"data": "x" * payload_size}
+    payload_bytes = json.dumps(payload).encode()
+    request_bytes = (
+        b"POST / HTTP/1.1\r\n"
+        b"Host: 127.0.0.1\r\n"
+        b"Content-Type: application/json\r\n"
+        b"Content-Length: %d\r\n"
+        b"Connection: keep-alive\r\n"
+        b"\r\n%s" % (len(payload_bytes), payload_bytes)
+    )
+
+    server_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server_sock.bind(("127.0.0.1", 0))
+    server_port = server_sock.getsockname()[1]
+    server_sock.listen(1)
+
+    pid = os.fork()
+    if pid == 0:
+        # Echo child: never returns into the benchmark.
+        _pin_to_cpu(_SERVER_CPU)
+        try:
             conn, _ = server_sock.accept()
-            try:
-                while True:
-                    data = conn.recv(65536)
-                    if not data:
-                        break
-                    conn.sendall(data)
-            except:
-                pass
-            finally:
-                conn.close()
-                server_sock.close()
-        
-        thread = threading.Thread(target=server_thread, daemon=True)
-        thread.start()
-        server_ready.wait()
-        
-        # Client
-        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        client.connect(socket_path)
-        
-        # Warmup
-        for _ in range(10):
-            client.sendall(payload)
-            client.recv(payload_size)
-        
-        # Benchmark
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            _raw_http_echo_loop(conn)
+        finally:
+            os._exit(0)
+
+    server_sock.close()
+
+    client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    client.connect(("127.0.0.1", server_port))
+
+    def read_response() -> None:
+        buf = bytearray()
+        while (header_end := buf.find(b"\r\n\r\n")) == -1:
+            chunk = client.recv(65536)
+            if not chunk:
+                raise ConnectionError("server closed connection mid-response")
+            buf += chunk
+        headers = bytes(buf[:header_end]).lower()
+        marker = headers.index(b"content-length:") + len(b"content-length:")
+        line_end = headers.find(b"\r\n", marker)
+        if line_end == -1:
+            line_end = len(headers)
+        content_length = int(headers[marker:line_end])
+        body_received = len(buf) - header_end - 4
+        while body_received < content_length:
+            chunk = client.recv(65536)
+            if not chunk:
+                raise ConnectionError("server closed connection mid-body")
+            body_received += len(chunk)
+
+    try:
         for _ in range(iterations):
             start = time.perf_counter_ns()
-            client.sendall(payload)
-            _ = client.recv(payload_size)
+            client.sendall(request_bytes)
+            read_response()
             elapsed = time.perf_counter_ns() - start
             samples.append(elapsed)
-        
+    finally:
         client.close()
-    
+        os.waitpid(pid, 0)
+
     return samples
 
 
-def benchmark_tcp_roundtrip(payload_size: int, iterations: int) -> List[int]:
-    """Benchmark TCP localhost IPC roundtrip."""
-    samples = []
+def benchmark_unix_socket_roundtrip(payload_size: int, iterations: int) -> "tuple[List[int], WelfordAccumulator]":
+    """Benchmark Unix socket IPC roundtrip.
+
+    The echo peer is a forked child on the other end of a socketpair, so
+    the timed path never contends with an in-process server thread for
+    the GIL and there is no bind/listen/accept handshake to set up.
+    """
+    # Flat int64 buffer: no boxed-int allocation or GC churn per sample.
+    samples = array.array("q", bytes(8 * iterations))
+    acc = WelfordAccumulator()
     payload = b"x" * payload_size
-    
+
+    client, peer = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+    _enable_busy_poll(client)
+    _enable_busy_poll(peer)
+
+    pid = os.fork()
+    if pid == 0:
+        # Echo child: never returns into the benchmark.
+        _pin_to_cpu(_SERVER_CPU)
+        client.close()
+        try:
+            while True:
+                data = peer.recv(65536)
+                if not data:
+                    break
+                peer.sendall(data)
+        finally:
+            os._exit(0)
+
+    peer.close()
+
+    try:
+        # Warmup
+        for _ in range(10):
+            client.sendall(payload)
+            client.recv(payload_size)
+
+        # Benchmark
+        if _clock_gettime is not None:
+            clk = _clock_gettime
+            t0, t1 = _Timespec(), _Timespec()
+            t0_ref, t1_ref = ctypes.byref(t0), ctypes.byref(t1)
+            for i in range(iterations):
+                clk(_CLOCK_MONOTONIC_RAW, t0_ref)
+                client.sendall(payload)
+                _ = client.recv(payload_size)
+                clk(_CLOCK_MONOTONIC_RAW, t1_ref)
+                elapsed = (t1.tv_sec - t0.tv_sec) * 1_000_000_000 + (t1.tv_nsec - t0.tv_nsec)
+                samples[i] = elapsed
+                acc.add(elapsed)
+        else:
+            for i in range(iterations):
+                start = time.perf_counter_ns()
+                client.sendall(payload)
+                _ = client.recv(payload_size)
+                elapsed = time.perf_counter_ns() - start
+                samples[i] = elapsed
+                acc.add(elapsed)
+    finally:
+        client.close()
+        os.waitpid(pid, 0)
+
+    return samples, acc
+
+
+def benchmark_tcp_roundtrip(payload_size: int, iterations: int) -> "tuple[List[int], WelfordAccumulator]":
+    """Benchmark TCP localhost IPC roundtrip.
+
+    The echo peer runs in a forked child for the same GIL-isolation
+    reasons as the Unix socket variant.
+    """
+    # Flat int64 buffer: no boxed-int allocation or GC churn per sample.
+    samples = array.array("q", bytes(8 * iterations))
+    acc = WelfordAccumulator()
+    payload = b"x" * payload_size
+
     # Set up server
     server_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     server_sock.bind(("127.0.0.1", 0))
     port = server_sock.getsockname()[1]
     server_sock.listen(1)
-    
-    server_ready = threading.Event()
-    
-    def server_thread():
-        server_ready.set()
-        conn, _ = server_sock.accept()
-        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    pid = os.fork()
+    if pid == 0:
+        # Echo child: never returns into the benchmark.
+        _pin_to_cpu(_SERVER_CPU)
         try:
+            conn, _ = server_sock.accept()
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            _enable_busy_poll(conn)
             while True:
                 data = conn.recv(65536)
                 if not data:
                     break
                 conn.sendall(data)
-        except:
-            pass
         finally:
-            conn.close()
-            server_sock.close()
-    
-    thread = threading.Thread(target=server_thread, daemon=True)
-    thread.start()
-    server_ready.wait()
-    
+            os._exit(0)
+
+    server_sock.close()
+
     # Client
     client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    _enable_busy_poll(client)
     client.connect(("127.0.0.1", port))
-    
-    # Warmup
-    for _ in range(10):
-        client.sendall(payload)
-        client.recv(payload_size)
-    
-    # Benchmark
-    for _ in range(iterations):
-        start = time.perf_counter_ns()
-        client.sendall(payload)
-        _ = client.recv(payload_size)
-        elapsed = time.perf_counter_ns() - start
-        samples.append(elapsed)
-    
-    client.close()
-    
+
+    try:
+        # Warmup
+        for _ in range(10):
+            client.sendall(payload)
+            client.recv(payload_size)
+
+        # Benchmark
+        if _clock_gettime is not None:
+            clk = _clock_gettime
+            t0, t1 = _Timespec(), _Timespec()
+            t0_ref, t1_ref = ctypes.byref(t0), ctypes.byref(t1)
+            for i in range(iterations):
+                clk(_CLOCK_MONOTONIC_RAW, t0_ref)
+                client.sendall(payload)
+                _ = client.recv(payload_size)
+                clk(_CLOCK_MONOTONIC_RAW, t1_ref)
+                elapsed = (t1.tv_sec - t0.tv_sec) * 1_000_000_000 + (t1.tv_nsec - t0.tv_nsec)
+                samples[i] = elapsed
+                acc.add(elapsed)
+        else:
+            for i in range(iterations):
+                start = time.perf_counter_ns()
+                client.sendall(payload)
+                _ = client.recv(payload_size)
+                elapsed = time.perf_counter_ns() - start
+                samples[i] = elapsed
+                acc.add(elapsed)
+    finally:
+        client.close()
+        os.waitpid(pid, 0)
+
+    return samples, acc
+
+
+def benchmark_tcp_pipelined_roundtrip(payload_size: int, iterations: int, depth: int = 8) -> List[int]:
+    """Benchmark TCP roundtrip with `depth` requests in flight.
+
+    The serial ping-pong variants measure pure per-op latency; a real
+    data plane keeps several requests outstanding and batches syscalls.
+    Keeping `depth` payloads in flight lets the echo child drain and
+    echo a whole batch per recv/sendall pair, so this measures the
+    throughput-limited per-op latency instead.
+    """
+    # Flat int64 buffer: no boxed-int allocation or GC churn per sample.
+    samples = array.array("q", bytes(8 * iterations))
+    payload = b"x" * payload_size
+    recv_buf = bytearray(payload_size)
+    recv_view = memoryview(recv_buf)
+
+    server_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server_sock.bind(("127.0.0.1", 0))
+    port = server_sock.getsockname()[1]
+    server_sock.listen(1)
+
+    pid = os.fork()
+    if pid == 0:
+        # Echo child: never returns into the benchmark.
+        _pin_to_cpu(_SERVER_CPU)
+        try:
+            conn, _ = server_sock.accept()
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # One recv/sendall pair covers up to a whole batch.
+            while True:
+                data = conn.recv(depth * payload_size)
+                if not data:
+                    break
+                conn.sendall(data)
+        finally:
+            os._exit(0)
+
+    server_sock.close()
+
+    client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    client.connect(("127.0.0.1", port))
+
+    def recv_exact():
+        got = 0
+        while got < payload_size:
+            n = client.recv_into(recv_view[got:], payload_size - got)
+            if n == 0:
+                raise ConnectionError("echo peer closed connection")
+            got += n
+
+    try:
+        # Prime the pipeline
+        for _ in range(depth):
+            client.sendall(payload)
+
+        # Benchmark: one send and one (batched) response per sample,
+        # with `depth` requests outstanding throughout.
+        for i in range(iterations):
+            start = time.perf_counter_ns()
+            client.sendall(payload)
+            recv_exact()
+            samples[i] = time.perf_counter_ns() - start
+
+        # Drain the outstanding responses
+        for _ in range(depth):
+            recv_exact()
+    finally:
+        client.close()
+        os.waitpid(pid, 0)
+
     return samples
 
 
+def benchmark_tcp_zerocopy_roundtrip(payload_size: int, iterations: int) -> Optional[List[int]]:
+    """Benchmark TCP roundtrip sending with MSG_ZEROCOPY.
+
+    Skips the userspace-to-kernel copy on the send side and drains the
+    completion notifications from the socket error queue. Zero-copy TCP
+    only pays off from a few KiB upward - the small-payload variants are
+    expected to show no gain, which is itself worth documenting.
+    Returns None when the kernel or socket refuses SO_ZEROCOPY.
+    """
+    # Fallback values cover CPython builds that predate these constants.
+    so_zerocopy = getattr(socket, "SO_ZEROCOPY", 60)
+    msg_zerocopy = getattr(socket, "MSG_ZEROCOPY", 0x4000000)
+    msg_errqueue = getattr(socket, "MSG_ERRQUEUE", 0x2000)
+
+    # Flat int64 buffer: no boxed-int allocation or GC churn per sample.
+    samples = array.array("q", bytes(8 * iterations))
+    payload = b"x" * payload_size
+
+    server_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server_sock.bind(("127.0.0.1", 0))
+    port = server_sock.getsockname()[1]
+    server_sock.listen(1)
+
+    # Enable SO_ZEROCOPY before forking the echo child: if the kernel
+    # refuses it there is no child blocked in accept() to deadlock on.
+    client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    try:
+        client.setsockopt(socket.SOL_SOCKET, so_zerocopy, 1)
+    except OSError:
+        client.close()
+        server_sock.close()
+        return None
+
+    pid = os.fork()
+    if pid == 0:
+        # Echo child: never returns into the benchmark. Drop the
+        # inherited client fd first, or the parent's close at teardown
+        # would never FIN the stream and recv would block forever.
+        client.close()
+        _pin_to_cpu(_SERVER_CPU)
+        try:
+            conn, _ = server_sock.accept()
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            while True:
+                data = conn.recv(65536)
+                if not data:
+                    break
+                conn.sendall(data)
+        finally:
+            os._exit(0)
+
+    server_sock.close()
+
+    def drain_completions():
+        while True:
+            try:
+                client.recvmsg(64, 512, msg_errqueue | socket.MSG_DONTWAIT)
+            except (BlockingIOError, InterruptedError):
+                break
+
+    try:
+        client.connect(("127.0.0.1", port))
+
+        # Warmup (also verifies the kernel accepts the send flag)
+        for _ in range(10):
+            client.send(payload, msg_zerocopy)
+            client.recv(payload_size)
+            drain_completions()
+
+        # Benchmark
+        for i in range(iterations):
+            start = time.perf_counter_ns()
+            client.send(payload, msg_zerocopy)
+            _ = client.recv(payload_size)
+            samples[i] = time.perf_counter_ns() - start
+            drain_completions()
+    except OSError:
+        # The child may still be blocked in accept() (e.g. the kernel
+        # rejected the MSG_ZEROCOPY send before connect completed), so
+        # don't wait on it until it has been told to die.
+        samples = None
+        os.kill(pid, signal.SIGKILL)
+    finally:
+        client.close()
+        os.waitpid(pid, 0)
+
+    return samples
+
+
+def benchmark_pipe_roundtrip(payload_size: int, iterations: int) -> List[int]:
+    """Benchmark pipe IPC roundtrip as a syscall-minimal lower bound.
+
+    Raw os.write/os.readv over a pipe pair into a preallocated buffer is
+    the cheapest kernel-mediated ping-pong expressible from the stdlib
+    (one syscall per direction, no socket state, no per-iteration
+    allocation), so it serves as the tuned-I/O floor the socket variants
+    and shared memory are compared against.
+    """
+    # Flat int64 buffer: no boxed-int allocation or GC churn per sample.
+    samples = array.array("q", bytes(8 * iterations))
+    payload = b"x" * payload_size
+    recv_buf = bytearray(payload_size)
+
+    c2s_read, c2s_write = os.pipe()
+    s2c_read, s2c_write = os.pipe()
+
+    pid = os.fork()
+    if pid == 0:
+        # Echo child: never returns into the benchmark.
+        _pin_to_cpu(_SERVER_CPU)
+        os.close(c2s_write)
+        os.close(s2c_read)
+        try:
+            while True:
+                data = os.read(c2s_read, 65536)
+                if not data:
+                    break
+                os.write(s2c_write, data)
+        finally:
+            os._exit(0)
+
+    os.close(c2s_read)
+    os.close(s2c_write)
+
+    try:
+        # Warmup
+        for _ in range(10):
+            os.write(c2s_write, payload)
+            os.readv(s2c_read, [recv_buf])
+
+        # Benchmark
+        for i in range(iterations):
+            start = time.perf_counter_ns()
+            os.write(c2s_write, payload)
+            os.readv(s2c_read, [recv_buf])
+            samples[i] = time.perf_counter_ns() - start
+    finally:
+        os.close(c2s_write)
+        os.close(s2c_read)
+        os.waitpid(pid, 0)
+
+    return samples
+
+
+def benchmark_shared_memory_roundtrip(payload_size: int, iterations: int) -> Optional[List[int]]:
+    """Benchmark shared-memory ping-pong via memfd + eventfd doorbells.
+
+    The payload lives in a single mmap'd memfd shared with a forked
+    child; each direction of the roundtrip is one eventfd doorbell
+    write, so no payload byte is copied through the kernel. This is the
+    zero-copy lower bound the Aetherless data plane is built around.
+    Returns None on platforms without memfd_create/eventfd.
+    """
+    if not (hasattr(os, "memfd_create") and hasattr(os, "eventfd")):
+        return None
+
+    # Flat int64 buffer: no boxed-int allocation or GC churn per sample.
+    samples = array.array("q", bytes(8 * iterations))
+    payload = b"x" * payload_size
+    warmup = 10
+
+    fd = os.memfd_create("aetherless-ipc")
+    os.ftruncate(fd, payload_size)
+    shm = mmap.mmap(fd, payload_size)
+    doorbell_c2s = os.eventfd(0)
+    doorbell_s2c = os.eventfd(0)
+
+    pid = os.fork()
+    if pid == 0:
+        # Echo child: never returns into the benchmark.
+        _pin_to_cpu(_SERVER_CPU)
+        try:
+            child_shm = mmap.mmap(fd, payload_size)
+            for _ in range(warmup + iterations):
+                os.eventfd_read(doorbell_c2s)
+                # Touch the shared page the way a consumer would.
+                _ = child_shm[0]
+                os.eventfd_write(doorbell_s2c, 1)
+        finally:
+            os._exit(0)
+
+    try:
+        # Warmup
+        for _ in range(warmup):
+            shm[:payload_size] = payload
+            os.eventfd_write(doorbell_c2s, 1)
+            os.eventfd_read(doorbell_s2c)
+
+        # Benchmark
+        for i in range(iterations):
+            start = time.perf_counter_ns()
+            shm[:payload_size] = payload
+            os.eventfd_write(doorbell_c2s, 1)
+            os.eventfd_read(doorbell_s2c)
+            samples[i] = time.perf_counter_ns() - start
+    finally:
+        shm.close()
+        os.close(fd)
+        os.close(doorbell_c2s)
+        os.close(doorbell_s2c)
+        os.waitpid(pid, 0)
+
+    return samples
+
+
+def result_row(name: str, iterations: int, metrics: LatencyMetrics,
+               method: str, size: int, zero_copy: bool = False) -> dict:
+    """Assemble one result entry for the report."""
+    return {
+        "name": name,
+        "category": "ipc",
+        "iterations": iterations,
+        "metrics": asdict(metrics),
+        "metadata": {
+            "method": method,
+            "payload_size_bytes": size,
+            "zero_copy": zero_copy,
+        },
+    }
+
+
 def format_latency(ns: int) -> str:
     if ns < 1_000:
         return f"{ns}ns"
@@ -230,9 +867,19 @@ def main():
     parser = argparse.ArgumentParser(description="HTTP IPC baseline benchmarks")
     parser.add_argument("--output", type=Path, default=Path("data"))
     parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--pin-cores", type=str, default=None, metavar="CLIENT,SERVER",
+                        help="Pin the client and echo peers to these CPUs "
+                             "(same L3/NUMA node recommended) to remove "
+                             "migration variance from p99")
     args = parser.parse_args()
-    
+
     args.output.mkdir(parents=True, exist_ok=True)
+
+    if args.pin_cores:
+        global _SERVER_CPU
+        client_cpu, _, server_cpu = args.pin_cores.partition(",")
+        _SERVER_CPU = int(server_cpu) if server_cpu else None
+        _pin_to_cpu(int(client_cpu))
     
     print("IPC Baseline Benchmarks")
     print("=" * 40)
@@ -258,74 +905,91 @@ def main():
         print("  Running http_json...")
         http_samples = benchmark_http_json_roundtrip(port, size, args.iterations)
         http_metrics = LatencyMetrics.from_samples(http_samples)
-        results.append({
-            "name": f"ipc_http_json_{size}",
-            "category": "ipc",
-            "iterations": args.iterations,
-            "metrics": {
-                "min_ns": http_metrics.min_ns,
-                "max_ns": http_metrics.max_ns,
-                "mean_ns": http_metrics.mean_ns,
-                "median_ns": http_metrics.median_ns,
-                "p95_ns": http_metrics.p95_ns,
-                "p99_ns": http_metrics.p99_ns,
-                "std_dev_ns": http_metrics.std_dev_ns,
-            },
-            "metadata": {
-                "method": "http_json",
-                "payload_size_bytes": size,
-                "zero_copy": False,
-            },
-        })
+        results.append(result_row(
+                f"ipc_http_json_{size}", args.iterations,
+                http_metrics, "http_json", size))
         
+        # HTTP with the JSON parse/serialize bypassed (control variant)
+        print("  Running http_nojson...")
+        nojson_samples = benchmark_http_json_roundtrip(port, size, args.iterations, path="/raw")
+        nojson_metrics = LatencyMetrics.from_samples(nojson_samples)
+        results.append(result_row(
+            f"ipc_http_nojson_{size}", args.iterations,
+            nojson_metrics, "http_nojson", size))
+
+        # HTTP + JSON, new connection per request
+        print("  Running http_json_cold_connect...")
+        cold_samples = benchmark_http_json_cold_connect(port, size, args.iterations)
+        cold_metrics = LatencyMetrics.from_samples(cold_samples)
+        results.append(result_row(
+                f"ipc_http_json_cold_connect_{size}", args.iterations,
+                cold_metrics, "http_json_cold_connect", size))
+
+        # HTTP + JSON over a raw pre-encoded request
+        print("  Running http_raw_socket...")
+        raw_samples = benchmark_http_raw_socket_roundtrip(size, args.iterations)
+        raw_metrics = LatencyMetrics.from_samples(raw_samples)
+        results.append(result_row(
+                f"ipc_http_raw_socket_{size}", args.iterations,
+                raw_metrics, "http_raw_socket", size))
+
         # Unix socket
         print("  Running unix_socket...")
-        unix_samples = benchmark_unix_socket_roundtrip(size, args.iterations)
-        unix_metrics = LatencyMetrics.from_samples(unix_samples)
-        results.append({
-            "name": f"ipc_unix_socket_{size}",
-            "category": "ipc",
-            "iterations": args.iterations,
-            "metrics": {
-                "min_ns": unix_metrics.min_ns,
-                "max_ns": unix_metrics.max_ns,
-                "mean_ns": unix_metrics.mean_ns,
-                "median_ns": unix_metrics.median_ns,
-                "p95_ns": unix_metrics.p95_ns,
-                "p99_ns": unix_metrics.p99_ns,
-                "std_dev_ns": unix_metrics.std_dev_ns,
-            },
-            "metadata": {
-                "method": "unix_socket",
-                "payload_size_bytes": size,
-                "zero_copy": False,
-            },
-        })
+        unix_samples, unix_acc = benchmark_unix_socket_roundtrip(size, args.iterations)
+        unix_metrics = LatencyMetrics.from_accumulator(unix_acc, unix_samples)
+        results.append(result_row(
+                f"ipc_unix_socket_{size}", args.iterations,
+                unix_metrics, "unix_socket", size))
         
         # TCP localhost
         print("  Running tcp_localhost...")
-        tcp_samples = benchmark_tcp_roundtrip(size, args.iterations)
-        tcp_metrics = LatencyMetrics.from_samples(tcp_samples)
-        results.append({
-            "name": f"ipc_tcp_localhost_{size}",
-            "category": "ipc",
-            "iterations": args.iterations,
-            "metrics": {
-                "min_ns": tcp_metrics.min_ns,
-                "max_ns": tcp_metrics.max_ns,
-                "mean_ns": tcp_metrics.mean_ns,
-                "median_ns": tcp_metrics.median_ns,
-                "p95_ns": tcp_metrics.p95_ns,
-                "p99_ns": tcp_metrics.p99_ns,
-                "std_dev_ns": tcp_metrics.std_dev_ns,
-            },
-            "metadata": {
-                "method": "tcp_localhost",
-                "payload_size_bytes": size,
-                "zero_copy": False,
-            },
-        })
+        tcp_samples, tcp_acc = benchmark_tcp_roundtrip(size, args.iterations)
+        tcp_metrics = LatencyMetrics.from_accumulator(tcp_acc, tcp_samples)
+        results.append(result_row(
+                f"ipc_tcp_localhost_{size}", args.iterations,
+                tcp_metrics, "tcp_localhost", size))
     
+        # TCP with a pipeline of outstanding requests
+        print("  Running tcp_pipelined...")
+        pipelined_samples = benchmark_tcp_pipelined_roundtrip(size, args.iterations)
+        pipelined_metrics = LatencyMetrics.from_samples(pipelined_samples)
+        pipelined_row = result_row(
+            f"ipc_tcp_pipelined_{size}", args.iterations,
+            pipelined_metrics, "tcp_pipelined", size)
+        pipelined_row["metadata"]["pipeline_depth"] = 8
+        results.append(pipelined_row)
+
+        # TCP with MSG_ZEROCOPY (only interesting for larger payloads)
+        if size >= 4096:
+            print("  Running tcp_zerocopy...")
+            zc_samples = benchmark_tcp_zerocopy_roundtrip(size, args.iterations)
+            if zc_samples is None:
+                print("    (skipped: SO_ZEROCOPY not supported)")
+            else:
+                zc_metrics = LatencyMetrics.from_samples(zc_samples)
+                results.append(result_row(
+                f"ipc_tcp_zerocopy_{size}", args.iterations,
+                zc_metrics, "tcp_zerocopy", size))
+
+        # Pipe
+        print("  Running pipe...")
+        pipe_samples = benchmark_pipe_roundtrip(size, args.iterations)
+        pipe_metrics = LatencyMetrics.from_samples(pipe_samples)
+        results.append(result_row(
+                f"ipc_pipe_{size}", args.iterations,
+                pipe_metrics, "pipe", size))
+
+        # Shared memory (memfd + eventfd doorbells)
+        print("  Running shared_memory...")
+        shm_samples = benchmark_shared_memory_roundtrip(size, args.iterations)
+        if shm_samples is None:
+            print("    (skipped: memfd_create/eventfd not available)")
+        else:
+            shm_metrics = LatencyMetrics.from_samples(shm_samples)
+            results.append(result_row(
+                f"ipc_shared_memory_{size}", args.iterations,
+                shm_metrics, "shared_memory", size, zero_copy=True))
+
     # Print summary
     print()
     print("Summary")
@@ -6,50 +6,106 @@
 Aetherless Function Handler - Hello World API
 Example handler demonstrating the Aetherless protocol.
 """
+import asyncio
 import os
 import socket
 import json
-from http.server import HTTPServer, BaseHTTPRequestHandler
-
-
-class Handler(BaseHTTPRequestHandler):
-    def do_GET(self):
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.end_headers()
-        
-        response = {
-            'message': 'Hello from Aetherless! 🚀',
-            'function': os.environ.get('AETHER_FUNCTION_ID', 'unknown'),
-            'path': self.path
-        }
-        self.wfile.write(json.dumps(response, indent=2).encode())
-    
-    def log_message(self, format, *args):
-        func_id = os.environ.get('AETHER_FUNCTION_ID', 'handler')
-        print(f"[{func_id}] {format % args}")
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; the stdlib event loop works fine.
+    uvloop = None
+
+
+# The response is static except for the echoed path, so serialise it
+# once at import time and splice the path in around a sentinel --
+# json.dumps(indent=2) per request is the slow pure-Python indent path.
+_BODY_PREFIX, _BODY_SUFFIX = json.dumps({
+    'message': 'Hello from Aetherless! 🚀',
+    'function': os.environ.get('AETHER_FUNCTION_ID', 'unknown'),
+    'path': '@path@'
+}, indent=2).encode().split(b'"@path@"')
+
+_HEADER = (
+    b'HTTP/1.1 200 OK\r\n'
+    b'Content-Type: application/json\r\n'
+    b'Content-Length: '
+)
+
+
+class Handler(asyncio.Protocol):
+    """Minimal asyncio HTTP handler.
+
+    A single protocol instance per connection replaces http.server's
+    thread-per-request model, and the hand-rolled request-line parse
+    replaces BaseHTTPRequestHandler's pure-Python header machinery --
+    this handler only needs the path.
+    """
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.buffer = b''
+
+    def data_received(self, data):
+        self.buffer += data
+        head, sep, rest = self.buffer.partition(b'\r\n\r\n')
+        if not sep:
+            return
+        self.buffer = rest
+        request_line = head.split(b'\r\n', 1)[0]
+        parts = request_line.split()
+        path = parts[1].decode('latin-1') if len(parts) >= 2 else '/'
+
+        body = _BODY_PREFIX + json.dumps(path).encode() + _BODY_SUFFIX
+        self.transport.write(
+            _HEADER + str(len(body)).encode() + b'\r\n\r\n' + body
+        )
+
+
+def signal_ready(socket_path):
+    """Signal READY to the orchestrator.
+
+    Abstract-namespace addresses (no leading '/') use SOCK_SEQPACKET so
+    the handshake skips the filesystem path walk and lands in a single
+    syscall; filesystem paths keep the plain stream connect the
+    orchestrator listens with today.
+    """
+    if socket_path.startswith('/'):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(socket_path)
+    else:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        sock.connect('\0' + socket_path)
+    sock.send(b'READY', socket.MSG_DONTWAIT)
+    return sock
+
+
+async def serve(function_id, port):
+    loop = asyncio.get_running_loop()
+    server = await loop.create_server(Handler, '0.0.0.0', port)
+    print(f"[{function_id}] Listening on http://0.0.0.0:{port}")
+    async with server:
+        await server.serve_forever()
 
 
 def main():
     function_id = os.environ.get('AETHER_FUNCTION_ID', 'hello')
     port = int(os.environ.get('AETHER_TRIGGER_PORT', '8080'))
-    
+
     # Connect to Aetherless orchestrator
     socket_path = os.environ.get('AETHER_SOCKET')
     if not socket_path:
         print(f"[{function_id}] ERROR: AETHER_SOCKET not set")
         return
-    
-    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-    sock.connect(socket_path)
-    sock.send(b'READY')  # Signal ready to orchestrator
+
+    sock = signal_ready(socket_path)
     print(f"[{function_id}] Connected to orchestrator")
-    
+
     # Start HTTP server
     print(f"[{function_id}] Starting on port {port}...")
-    server = HTTPServer(('0.0.0.0', port), Handler)
-    print(f"[{function_id}] Listening on http://0.0.0.0:{port}")
-    server.serve_forever()
+    if uvloop is not None:
+        uvloop.install()
+    asyncio.run(serve(function_id, port))
 
 
 if __name__ == '__main__':
@@ -6,59 +6,127 @@
 Aetherless REST API Handler Example
 Demonstrates routing and JSON request/response handling.
 """
+import asyncio
 import os
 import socket
 import json
-from http.server import HTTPServer, BaseHTTPRequestHandler
-
-
-class APIHandler(BaseHTTPRequestHandler):
-    def do_GET(self):
-        routes = {
-            '/users': {'users': [{'id': 1, 'name': 'Alice'}, {'id': 2, 'name': 'Bob'}]},
-            '/health': {'status': 'healthy', 'function': os.environ.get('AETHER_FUNCTION_ID')},
-            '/': {'message': 'Welcome to Aetherless REST API'},
-        }
-        response = routes.get(self.path, {'error': 'Not found', 'path': self.path})
-        status = 200 if self.path in routes else 404
-        
-        self.send_response(status)
-        self.send_header('Content-Type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps(response, indent=2).encode())
-
-    def do_POST(self):
-        content_length = int(self.headers.get('Content-Length', 0))
-        body = json.loads(self.rfile.read(content_length)) if content_length else {}
-        
-        self.send_response(201)
-        self.send_header('Content-Type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps({'created': body, 'id': 123}).encode())
-
-    def log_message(self, format, *args):
-        func_id = os.environ.get('AETHER_FUNCTION_ID', 'api')
-        print(f"[{func_id}] {format % args}")
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; the stdlib event loop works fine.
+    uvloop = None
+
+
+ROUTES = {
+    '/users': {'users': [{'id': 1, 'name': 'Alice'}, {'id': 2, 'name': 'Bob'}]},
+    '/health': {'status': 'healthy', 'function': os.environ.get('AETHER_FUNCTION_ID')},
+    '/': {'message': 'Welcome to Aetherless REST API'},
+}
+
+
+_REASONS = {200: 'OK', 201: 'Created', 404: 'Not Found'}
+
+
+def _render(status, response):
+    body = json.dumps(response, indent=2).encode()
+    return (
+        b'HTTP/1.1 ' + str(status).encode() + b' ' + _REASONS[status].encode() + b'\r\n'
+        b'Content-Type: application/json\r\n'
+        b'Content-Length: ' + str(len(body)).encode() + b'\r\n'
+        b'\r\n' + body
+    )
+
+
+# The route payloads are static, so render the full response bytes
+# (headers included) once at import time; only 404s and POST echoes are
+# serialised per request.
+_ROUTE_RESPONSES = {path: _render(200, response) for path, response in ROUTES.items()}
+
+
+class APIHandler(asyncio.Protocol):
+    """Minimal asyncio HTTP handler with GET routing and POST echo.
+
+    A single protocol instance per connection replaces http.server's
+    thread-per-request model; only the request line and Content-Length
+    are parsed, which is all the routing needs.
+    """
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.buffer = b''
+
+    def data_received(self, data):
+        self.buffer += data
+        head, sep, rest = self.buffer.partition(b'\r\n\r\n')
+        if not sep:
+            return
+        request_line, _, header_block = head.partition(b'\r\n')
+        parts = request_line.split()
+        method = parts[0].decode('latin-1') if parts else 'GET'
+        path = parts[1].decode('latin-1') if len(parts) >= 2 else '/'
+
+        content_length = 0
+        for line in header_block.split(b'\r\n'):
+            if line[:15].lower() == b'content-length:':
+                content_length = int(line[15:])
+                break
+        if len(rest) < content_length:
+            return  # wait for the rest of the body
+        body, self.buffer = rest[:content_length], rest[content_length:]
+
+        if method == 'POST':
+            payload = json.loads(body) if body else {}
+            self.transport.write(_render(201, {'created': payload, 'id': 123}))
+        else:
+            cached = _ROUTE_RESPONSES.get(path)
+            if cached is None:
+                cached = _render(404, {'error': 'Not found', 'path': path})
+            self.transport.write(cached)
+
+
+def signal_ready(socket_path):
+    """Signal READY to the orchestrator.
+
+    Abstract-namespace addresses (no leading '/') use SOCK_SEQPACKET so
+    the handshake skips the filesystem path walk and lands in a single
+    syscall; filesystem paths keep the plain stream connect the
+    orchestrator listens with today.
+    """
+    if socket_path.startswith('/'):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(socket_path)
+    else:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        sock.connect('\0' + socket_path)
+    sock.send(b'READY', socket.MSG_DONTWAIT)
+    return sock
+
+
+async def serve(function_id, port):
+    loop = asyncio.get_running_loop()
+    server = await loop.create_server(APIHandler, '0.0.0.0', port)
+    print(f"[{function_id}] Listening on http://0.0.0.0:{port}")
+    async with server:
+        await server.serve_forever()
 
 
 def main():
     function_id = os.environ.get('AETHER_FUNCTION_ID', 'rest-api')
     port = int(os.environ.get('AETHER_TRIGGER_PORT', '3000'))
-    
+
     # Connect to orchestrator
     socket_path = os.environ.get('AETHER_SOCKET')
     if not socket_path:
         print(f"[{function_id}] ERROR: AETHER_SOCKET not set")
         return
-    
-    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-    sock.connect(socket_path)
-    sock.send(b'READY')
+
+    sock = signal_ready(socket_path)
     print(f"[{function_id}] Connected to orchestrator")
-    
+
     print(f"[{function_id}] Starting REST API on port {port}...")
-    server = HTTPServer(('0.0.0.0', port), APIHandler)
-    server.serve_forever()
+    if uvloop is not None:
+        uvloop.install()
+    asyncio.run(serve(function_id, port))
 
 
 if __name__ == '__main__':